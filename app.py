@@ -4,20 +4,33 @@ from supabase import create_client, Client
 from streamlit_audio_recorder import audio_recorder
 from bs4 import BeautifulSoup
 import requests
+import aiohttp
+import asyncio
 import os
 from dotenv import load_dotenv
 import nltk
-from nltk.corpus import wordnet
 import random
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import language_tool_python
 from urllib.parse import urljoin
 import datetime
+import pickle
+import sqlite3
+import time
+from contextlib import closing
 import stripe
+from question_gen import parse_texts, pick_paragraph, generate_question_from_text, paraphrase_simple, make_questions, WorkerContext
 
-# First-time downloads
-nltk.download('punkt')
-nltk.download('wordnet')
-nltk.download('omw-1.4')
+# First-time downloads (once per server, not on every rerun).
+# No spinner: this runs before st.set_page_config, which must be the first element sent.
+@st.cache_resource(show_spinner=False)
+def ensure_nltk():
+    nltk.download('wordnet')
+    nltk.download('omw-1.4')
+
+ensure_nltk()
 
 load_dotenv()
 
@@ -33,86 +46,204 @@ if not SUPABASE_URL or not (SUPABASE_KEY or SUPABASE_ANON):
     st.stop()
 
 # Create Supabase clients (server and client)
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_ANON or SUPABASE_KEY)
+# One client per browser session, so its keep-alive HTTP connections are reused across reruns.
+# Not st.cache_resource: that would share one auth session between every user of the server.
+def get_supa() -> Client:
+    if 'supa' not in st.session_state:
+        st.session_state['supa'] = create_client(SUPABASE_URL, SUPABASE_ANON or SUPABASE_KEY)
+    return st.session_state['supa']
+
+supabase: Client = get_supa()
 
-# grammar tool
-tool = language_tool_python.LanguageTool('en-US')
+# grammar tool: starts a Java server, so create it lazily and share it across reruns
+@st.cache_resource
+def get_langtool():
+    return language_tool_python.LanguageTool('en-US')
 
 # ---------- Helper utilities ----------
-def paraphrase_simple(text):
-    """
-    Lightweight rephrasing function WITHOUT GenAI:
-    - splits into sentences
-    - applies synonym substitution on some nouns/adjectives using WordNet
-    - shuffles some clauses.
-    NOTE: this is intentionally conservative to avoid factual distortion.
-    """
-    from nltk.tokenize import sent_tokenize, word_tokenize, pos_tag
-    sents = sent_tokenize(text)
-    out_sents = []
-    for sent in sents:
-        words = word_tokenize(sent)
-        tags = nltk.pos_tag(words)
-        new_words = []
-        for w, t in tags:
-            # attempt synonyms for adjectives and nouns sometimes
-            if t.startswith('NN') or t.startswith('JJ'):
-                if random.random() < 0.28:
-                    syns = wordnet.synsets(w)
-                    if syns:
-                        lemmas = [l.name().replace('_', ' ') for s in syns for l in s.lemmas()]
-                        lemmas = [x for x in lemmas if x.lower() != w.lower()]
-                        if lemmas:
-                            w = random.choice(lemmas)
-            new_words.append(w)
-        out_sents.append(' '.join(new_words))
-    # maybe shuffle sentences a bit (to create novel ordering)
-    if len(out_sents) > 1 and random.random() < 0.3:
-        random.shuffle(out_sents)
-    return ' '.join(out_sents)
-
-def generate_question_from_text(text, topic):
-    """
-    Create an advanced, targeted question from the article text.
-    Strategy:
-      - pick a paragraph, identify important nouns, make scenario-based or 'how would you' questions.
-    """
-    paras = [p for p in text.split('\n') if p.strip()]
-    if not paras: paras = [text]
-    para = random.choice(paras[:5])  # prefer first few paragraphs
-    # pick nouns via simple heuristic
-    tokens = nltk.word_tokenize(para)
-    tags = nltk.pos_tag(tokens)
-    nouns = [w for w, t in tags if t.startswith('NN') and len(w) > 3]
-    nouns = list(dict.fromkeys(nouns))
-    chosen = nouns[:3] if nouns else []
-    # craft tough question
-    if chosen:
-        core = ', '.join(chosen[:2])
-        q = f"In a production scenario involving {core}, what are the top non-obvious trade-offs you would evaluate, and how would you mitigate the top two risks? (Tie it into {topic} context.)"
-    else:
-        q = f"Describe an advanced challenge in {topic} that can arise from the technology discussed in the source, and propose a step-by-step resolution strategy."
-    return q
+# Question generation is CPU-bound; keep a warm pool across reruns. spawn rather than fork because the
+# Streamlit server is multi-threaded; WorkerContext keeps the children from re-running app.py.
+# Workers run question_gen.make_questions.
+@st.cache_resource(show_spinner=False)
+def get_process_pool():
+    return ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=WorkerContext())
+
+def extract_text(html, max_chars=2000):
+    soup = BeautifulSoup(html, 'lxml')
+    # try article tags, then paragraphs; stop collecting once we have max_chars
+    root = soup.find('article') or soup
+    parts, total = [], 0
+    for p in root.find_all('p'):
+        part = p.get_text(separator=' ', strip=True)
+        parts.append(part)
+        total += len(part) + 1
+        if total >= max_chars:
+            break
+    return ' '.join(parts)[:max_chars]
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "arty")
+MAX_FETCH_CHARS = 4000  # largest max_chars any caller asks for
+URL_CACHE_ROWS = 500
+
+# Persistent page cache for conditional re-fetches: url -> (etag, last_modified, text).
+# Text is extracted at MAX_FETCH_CHARS; extract_text() for a smaller max_chars is a prefix of that.
+def _url_cache():
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    conn = sqlite3.connect(os.path.join(CACHE_DIR, "urls.sqlite"))
+    conn.execute("create table if not exists pages (url text primary key, etag text, last_modified text, body text, fetched_at real)")
+    return conn
+
+def get_cached(urls):
+    try:
+        with closing(_url_cache()) as conn:
+            rows = conn.execute(f"select url, etag, last_modified, body from pages where url in ({','.join('?' * len(urls))})",
+                                tuple(urls)).fetchall()
+    except sqlite3.Error:
+        rows = []
+    return {u: (etag, last_modified, body) for u, etag, last_modified, body in rows}
+
+def put_cached(rows):
+    # rows of (url, etag, last_modified, text); pages without a validator can't be revalidated, so skip them
+    now = time.time()
+    rows = [(u, etag, last_modified, text, now) for u, etag, last_modified, text in rows if etag or last_modified]
+    if not rows:
+        return
+    try:
+        with closing(_url_cache()) as conn, conn:
+            conn.executemany("insert or replace into pages values (?, ?, ?, ?, ?)", rows)
+            # bounded: keep only the most recently fetched pages
+            conn.execute("delete from pages where url not in (select url from pages order by fetched_at desc limit ?)",
+                         (URL_CACHE_ROWS,))
+    except sqlite3.Error:
+        pass
+
+def revalidation_headers(etag, last_modified):
+    headers = {}
+    if etag:
+        headers['If-None-Match'] = etag
+    if last_modified:
+        headers['If-Modified-Since'] = last_modified
+    return headers
+
+# Cached fetch; raises on failure so the error isn't cached (st.cache_data doesn't store exceptions)
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_text_from_url(url, max_chars):
+    etag, last_modified, text = get_cached([url]).get(url, (None, None, None))
+    headers = {'User-Agent':'ARTyBot/1.0', **revalidation_headers(etag, last_modified)}
+    resp = requests.get(url, timeout=8, headers=headers)
+    if resp.status_code == 304:
+        return text[:max_chars]
+    resp.raise_for_status()
+    text = extract_text(resp.text, MAX_FETCH_CHARS)
+    put_cached([(url, resp.headers.get('ETag'), resp.headers.get('Last-Modified'), text)])
+    return text[:max_chars]
 
 # Simple function to fetch & extract textual content from a given URL (first-level)
 def fetch_text_from_url(url, max_chars=2000):
     try:
-        resp = requests.get(url, timeout=8, headers={'User-Agent':'ARTyBot/1.0'})
-        resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, 'html.parser')
-        # try article tags, then paragraphs
-        article = soup.find('article')
-        if article:
-            text = ' '.join([p.get_text(separator=' ', strip=True) for p in article.find_all('p')])
-        else:
-            paras = soup.find_all('p')
-            text = ' '.join([p.get_text(separator=' ', strip=True) for p in paras])
-        if len(text) > max_chars:
-            text = text[:max_chars]
-        return text
+        return _fetch_text_from_url(url, max_chars)
     except Exception as e:
         return None
 
+# Returns None for 304 Not Modified, else (html, etag, last_modified)
+async def fetch_async(session, url, etag=None, last_modified=None):
+    async with session.get(url, timeout=aiohttp.ClientTimeout(total=8),
+                           headers=revalidation_headers(etag, last_modified)) as resp:
+        if resp.status == 304:
+            return None
+        resp.raise_for_status()
+        return await resp.text(), resp.headers.get('ETag'), resp.headers.get('Last-Modified')
+
+async def fetch_many(urls, validators):
+    async with aiohttp.ClientSession(headers={'User-Agent':'ARTyBot/1.0'}) as session:
+        return await asyncio.gather(*[fetch_async(session, u, *validators.get(u, (None, None))) for u in urls],
+                                    return_exceptions=True)
+
+class PartialFetch(Exception):
+    # raised out of the cached fetch when some pages failed, so that result isn't cached; carries the rest
+    def __init__(self, results):
+        super().__init__("some pages could not be fetched")
+        self.results = results
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_texts_from_urls(urls, max_chars):
+    # sqlite reads/writes happen before and after the gather, never inside the event loop
+    cached = get_cached(urls)
+    pages = asyncio.run(fetch_many(urls, {u: (etag, last_modified) for u, (etag, last_modified, _) in cached.items()}))
+    out, fresh, failed = [], [], False
+    for u, page in zip(urls, pages):
+        if isinstance(page, BaseException):
+            failed = True
+            continue
+        if page is None:
+            text = cached[u][2]
+        else:
+            html, etag, last_modified = page
+            try:
+                text = extract_text(html, MAX_FETCH_CHARS)
+            except Exception:
+                failed = True
+                continue
+            fresh.append((u, etag, last_modified, text))
+        if text:
+            out.append((u, text[:max_chars]))
+    put_cached(fresh)
+    if failed:
+        raise PartialFetch(out)
+    return out
+
+# Fetch several URLs concurrently; returns (url, text) for the ones that worked, in input order.
+# Only fully successful batches are cached; a batch with failures is retried on the next call.
+def fetch_texts_from_urls(urls, max_chars=2000):
+    if not urls:
+        return []
+    try:
+        return _fetch_texts_from_urls(urls, max_chars)
+    except PartialFetch as e:
+        return e.results
+
+# Canonical sources per topic keyword (first word of the topic). They don't change per request.
+DEFAULT_LOOKUP = {
+    "devops": ["https://aws.amazon.com/devops/what-is-devops/"],
+    "cloud": ["https://azure.microsoft.com/en-us/overview/what-is-cloud-computing/"],
+    "rpa": ["https://www.uipath.com/rpa/robotic-process-automation"],
+    "kubernetes": [
+        "https://kubernetes.io/docs/concepts/overview/what-is-kubernetes/",
+        "https://aws.amazon.com/containers/what-is-kubernetes/"
+    ]
+}
+DEFAULT_SEEDS_TTL = 86400
+
+# Fetch every default source once a day and keep a copy on disk, so a restarted server doesn't need
+# outbound HTTP either. Topics whose pages all failed are left out (callers then fetch them live).
+@st.cache_resource(ttl=DEFAULT_SEEDS_TTL, show_spinner=False)
+def default_seed_texts():
+    path = os.path.join(CACHE_DIR, "default_seed_texts.pkl")
+    try:
+        if time.time() - os.path.getmtime(path) < DEFAULT_SEEDS_TTL:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+    all_urls = tuple(u for urls in DEFAULT_LOOKUP.values() for u in urls)
+    by_url = dict(fetch_texts_from_urls(all_urls, max_chars=3000))
+    seeds = {}
+    for key, urls in DEFAULT_LOOKUP.items():
+        fetched = [(u, by_url[u]) for u in urls if u in by_url]
+        if fetched:
+            seeds[key] = fetched
+    if seeds:
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(path + ".tmp", "wb") as f:
+                pickle.dump(seeds, f)
+            os.replace(path + ".tmp", path)
+        except OSError:
+            pass
+    return seeds
+
+default_seed_texts()  # warm at startup rather than on the first Generate click
+
 # ---------- UI ----------
 st.set_page_config(page_title="AI Interview Coach by ARTy (ARTy)", layout="wide")
 st.title("AI Interview Coach by ARTy 🎤🤖")
@@ -157,8 +288,10 @@ except Exception:
     current_user = None
 
 if not current_user:
-    current_user = "guest_" + (st.session_state.get("guest_id") or str(random.randint(1000,9999)))
-    st.session_state["guest_id"] = current_user
+    # keep only the random suffix in session_state so the guest id is stable across reruns
+    if "guest_id" not in st.session_state:
+        st.session_state["guest_id"] = str(random.randint(1000,9999))
+    current_user = "guest_" + st.session_state["guest_id"]
 
 st.sidebar.write("User:", current_user)
 
@@ -189,51 +322,47 @@ with tabs[0]:
         #  - If user supplied URLs: fetch text from them.
         #  - Otherwise: attempt a quick heuristic: use official pages in a default set (local fallback).
         urls = [u.strip() for u in (extra_urls.splitlines() if extra_urls else []) if u.strip()]
-        seed_texts = []
-        for u in urls:
-            t = fetch_text_from_url(u)
-            if t:
-                seed_texts.append((u, t))
+        seed_texts = fetch_texts_from_urls(tuple(urls))
         if not seed_texts:
             # fallback: look for some canonical sources for the topic (simplified)
             st.info("No valid URLs provided or fetch failed — using default curated sources (lightweight).")
-            default_lookup = {
-                "devops": ["https://aws.amazon.com/devops/what-is-devops/"],
-                "cloud": ["https://azure.microsoft.com/en-us/overview/what-is-cloud-computing/"],
-                "rpa": ["https://www.uipath.com/rpa/robotic-process-automation"]
-            }
             key = topic.lower().split()[0]
-            for u in default_lookup.get(key, []):
-                t = fetch_text_from_url(u)
-                if t:
-                    seed_texts.append((u,t))
+            seed_texts = [(u, t[:2000]) for u, t in default_seed_texts().get(key, [])]
+            if not seed_texts:
+                seed_texts = fetch_texts_from_urls(tuple(DEFAULT_LOOKUP.get(key, [])))
         # if still empty, create generic prompts from topic
         if not seed_texts:
             seed_texts = [("local_fallback", f"This is a fallback paragraph about {topic}. Focus on real-world constraints, scaling, security, and maintainability.")]
 
-        saved_qs = []
-        for i in range(n_q):
-            src_url, text = random.choice(seed_texts)
-            q_text = generate_question_from_text(text, topic)
-            # rephrase the question to avoid exact wording using paraphrase_simple
-            q_text = paraphrase_simple(q_text)
-            saved_qs.append({"interview_id": interview_id, "topic": topic, "q_text": q_text, "source_url": src_url})
-            # batch insert every 15 questions
-            if len(saved_qs) >= 15:
-                supabase.table("questions").insert(saved_qs).execute()
-                saved_qs = []
-        if saved_qs:
-            supabase.table("questions").insert(saved_qs).execute()
+        # pick every source paragraph up front so spaCy can tag them in batches
+        idxs = np.random.randint(0, len(seed_texts), size=n_q)
+        chosen = [seed_texts[i] for i in idxs]
+        # one contiguous chunk per worker so each still tags its texts in a single spaCy batch
+        texts = [text for _, text in chosen]
+        size = -(-len(texts) // (os.cpu_count() or 1))
+        chunks = [texts[i:i + size] for i in range(0, len(texts), size)]
+        try:
+            q_texts = [q for qs in get_process_pool().map(make_questions, chunks, [topic] * len(chunks)) for q in qs]
+        except BrokenProcessPool:
+            # a dead worker breaks the pool for good: drop it so the next click starts a fresh one
+            get_process_pool.clear()
+            q_texts = make_questions(texts, topic)
+        saved_qs = [{"interview_id": interview_id, "topic": topic, "q_text": q_text, "source_url": src_url}
+                    for (src_url, _), q_text in zip(chosen, q_texts)]
+        # one insert for the whole batch (PostgREST accepts an array body)
+        supabase.table("questions").insert(saved_qs).execute()
+        # keep the preview in memory so reruns don't re-query it
+        st.session_state['preview_qs'] = saved_qs[:10]
         st.success(f"Generated and saved {n_q} questions. You can now go to the Record tab to answer them (tab locked until generation).")
         # mark that generation done
         st.session_state['generated'] = True
 
     # Show a preview of questions if present
     if st.session_state.get('last_interview_id'):
-        preview = supabase.table("questions").select("*").eq("interview_id", st.session_state['last_interview_id']).limit(10).execute()
+        preview_qs = st.session_state.get('preview_qs', [])
         st.subheader("Preview (first 10 questions)")
-        if preview.data:
-            for idx, q in enumerate(preview.data, start=1):
+        if preview_qs:
+            for idx, q in enumerate(preview_qs, start=1):
                 st.markdown(f"**Q{idx}.** {q['q_text']}")
                 if q.get('source_url') and q['source_url'] != 'local_fallback':
                     st.caption(q['source_url'])
@@ -247,9 +376,12 @@ with tabs[1]:
         st.warning("Recording is disabled until you generate questions in the Generate tab for this session.")
     else:
         interview_id = st.session_state.get('last_interview_id')
-        # fetch questions
-        qres = supabase.table("questions").select("*").eq("interview_id", interview_id).execute()
-        questions = qres.data or []
+        # fetch questions once per interview; reruns read them from session_state
+        questions_cache = st.session_state.setdefault('questions_cache', {})
+        if interview_id not in questions_cache:
+            qres = supabase.table("questions").select("*").eq("interview_id", interview_id).execute()
+            questions_cache[interview_id] = qres.data or []
+        questions = questions_cache[interview_id]
         q_index = st.number_input("Question index", min_value=1, max_value=max(1, len(questions)), value=1)
         q = questions[q_index-1] if questions else {"q_text":"No questions found."}
         st.subheader(f"Q{q_index}: {q['q_text']}")
@@ -260,18 +392,18 @@ with tabs[1]:
         audio_bytes = audio_recorder(text="Press to record your answer (webcam/mic permission required).")
         answer_text = st.text_area("Or paste your written answer (optional).")
 
-        if audio_bytes:
-            # upload audio to Supabase Storage: placeholder - supabase.from_... (requires bucket configured)
-            # We'll store audio as binary in Storage or provide a signed URL. For demo we'll save a local file and upload
+        # the recorder returns the same clip on every rerun; only upload/save it once
+        if audio_bytes and st.session_state.get('saved_audio') != hash(audio_bytes):
+            # upload audio to Supabase Storage straight from memory (requires bucket configured);
+            # fn is only the object name, nothing is written to local disk
             fn = f"answer_{current_user}_{datetime.datetime.utcnow().isoformat()}.wav".replace(":", "-")
-            with open(fn, "wb") as f:
-                f.write(audio_bytes)
-            st.success("Audio recorded locally (demo). In production, upload to Supabase Storage & save URL.")
+            st.success("Audio recorded. Uploading to Supabase Storage & saving URL.")
             # upload to storage (if bucket configured)
             try:
                 # ensure bucket 'answers' exists in your Supabase storage
-                up = supabase.storage().from_('answers').upload(fn, open(fn, "rb"))
-                public_url = supabase.storage().from_('answers').get_public_url(fn).get('publicURL') or ''
+                bucket = supabase.storage().from_('answers')
+                up = bucket.upload(fn, audio_bytes, {'content-type': 'audio/wav'})
+                public_url = bucket.get_public_url(fn).get('publicURL') or ''
             except Exception as e:
                 public_url = ""
             # save answer metadata in DB
@@ -282,6 +414,8 @@ with tabs[1]:
                 "audio_url": public_url
             }
             supabase.table("answers").insert(insert).execute()
+            st.session_state['saved_audio'] = hash(audio_bytes)
+            st.session_state['answers_changed'] = True
             st.info("Saved answer metadata to DB.")
         if st.button("Save text answer"):
             supabase.table("answers").insert({
@@ -290,6 +424,7 @@ with tabs[1]:
                 "answer_text": answer_text,
                 "audio_url": None
             }).execute()
+            st.session_state['answers_changed'] = True
             st.success("Answer saved (text).")
 
 # ---------- PRACTICE (writing) TAB ----------
@@ -314,7 +449,7 @@ with tabs[2]:
                 st.warning("Please write at least 4 lines to practice.")
             else:
                 # grammar check
-                matches = tool.check(practice_input)
+                matches = get_langtool().check(practice_input)
                 corrected = language_tool_python.utils.correct(practice_input, matches)
                 st.subheader("Corrected version (grammar & style suggestions)")
                 st.text_area("Corrected", value=corrected, height=220)
@@ -331,6 +466,7 @@ with tabs[2]:
                     "answer_text": corrected,
                     "audio_url": None
                 }).execute()
+                st.session_state['answers_changed'] = True
                 st.success("Practice answer corrected and saved for review.")
 
 # ---------- READ / TOPIC TAB ----------
@@ -348,49 +484,60 @@ with tabs[3]:
                 sources.append((url_read, text))
         else:
             # naive search: a few canonical pages (in production use search API)
-            fallback_urls = [
-                "https://kubernetes.io/docs/concepts/overview/what-is-kubernetes/",
-                "https://aws.amazon.com/containers/what-is-kubernetes/"
-            ]
-            for u in fallback_urls:
-                t = fetch_text_from_url(u, max_chars=3000)
-                if t:
-                    sources.append((u, t))
+            sources = default_seed_texts().get("kubernetes") or \
+                fetch_texts_from_urls(tuple(DEFAULT_LOOKUP["kubernetes"]), max_chars=3000)
         if not sources:
             st.error("Failed to fetch any sources for this topic.")
         else:
             st.success(f"Fetched {len(sources)} sources. Generating {n_pair} Q&A pairs.")
             qa_list = []
-            for i in range(n_pair):
-                src_url, text = random.choice(sources)
-                q = generate_question_from_text(text, topic_read)
-                a = paraphrase_simple(text[:400])  # concise rephrased answer block from source
+            idxs = np.random.randint(0, len(sources), size=n_pair)
+            picks = [sources[i] for i in idxs]
+            q_docs = parse_texts([pick_paragraph(text) for _, text in picks])
+            a_docs = parse_texts([text[:400] for _, text in picks])
+            for i, ((src_url, text), q_doc, a_doc) in enumerate(zip(picks, q_docs, a_docs)):
+                q = generate_question_from_text(q_doc, topic_read)
+                a = paraphrase_simple(a_doc)  # concise rephrased answer block from source
                 # Save in DB as a "question" with source
-                supabase.table("questions").insert({
+                qa_list.append({
                     "interview_id": st.session_state.get("last_interview_id"),
                     "topic": topic_read,
                     "q_text": q,
                     "source_url": src_url
-                }).execute()
+                })
                 st.markdown(f"**Q{i+1}.** {q}")
                 st.caption(src_url)
                 st.write(a)
                 st.write("---")
+            supabase.table("questions").insert(qa_list).execute()
+            # these were added to the current interview, so the Record tab must re-fetch
+            st.session_state.get('questions_cache', {}).pop(st.session_state.get("last_interview_id"), None)
 
 # ---------- REVIEW PAST TAB ----------
 with tabs[4]:
     st.header("5) Review Past Answers & Activity")
     st.write("View saved answers with timestamps. Data is stored in Supabase (free tier is fine for light usage).")
+    refresh = st.button("Refresh")
     try:
-        ares = supabase.table("answers").select("id, question_id, answer_text, audio_url, created_at").eq("user_id", current_user).order("created_at", desc=True).limit(50).execute()
-        items = ares.data or []
+        # query only on first view, after an answer was saved this session, or on Refresh;
+        # other reruns (every widget interaction anywhere in the app) reuse the last result
+        if refresh or st.session_state.get('answers_changed') or st.session_state.get('review_user') != current_user:
+            # metadata only; answer_text can be large, so it is loaded per row on demand below
+            ares = supabase.table("answers").select("id, question_id, audio_url, created_at").eq("user_id", current_user).order("created_at", desc=True).limit(50).execute()
+            st.session_state['review_items'] = ares.data or []
+            st.session_state['review_user'] = current_user
+            st.session_state['answers_changed'] = False
+        items = st.session_state['review_items']
+        answer_texts = st.session_state.setdefault('answer_texts', {})
         for it in items:
-            st.write(f"**Saved at:** {it.get('created_at')}")
-            if it.get('answer_text'):
-                st.text_area("answer", value=it.get('answer_text'), height=120)
-            if it.get('audio_url'):
-                st.audio(it.get('audio_url'))
-            st.markdown("---")
+            with st.expander(f"Saved at: {it.get('created_at')}"):
+                if it['id'] not in answer_texts and st.button("Load answer text", key=f"load_{it['id']}"):
+                    tres = supabase.table("answers").select("answer_text").eq("id", it['id']).execute()
+                    answer_texts[it['id']] = tres.data[0].get('answer_text') if tres.data else ""
+                if answer_texts.get(it['id']):
+                    st.text_area("answer", value=answer_texts[it['id']], height=120, key=f"answer_{it['id']}")
+                if it.get('audio_url'):
+                    st.audio(it.get('audio_url'))
     except Exception as e:
         st.write("Could not fetch answers. Check Supabase keys and policies.")
 
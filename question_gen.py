@@ -0,0 +1,115 @@
+# question_gen.py
+# spaCy/WordNet question helpers. They live outside app.py so worker processes can import them
+# (and, unlike app.py, this module is not re-executed on every Streamlit rerun, so the caches stick).
+import random
+import re
+import sys
+import types
+import multiprocessing.context
+from itertools import islice
+from functools import lru_cache
+import numpy as np
+import spacy
+from nltk.corpus import wordnet
+
+# spawn re-executes sys.modules['__main__'].__file__ in every child, and while app.py runs Streamlit points
+# __main__ at app.py itself -- each worker would redo downloads, Supabase setup and the whole UI. Start
+# workers under an empty __main__ instead. (Defined here, not in app.py, so children can unpickle it.)
+class _NeutralMainProcess(multiprocessing.context.SpawnProcess):
+    def start(self):
+        script_main = sys.modules['__main__']
+        sys.modules['__main__'] = types.ModuleType('__main__')
+        try:
+            super().start()
+        finally:
+            sys.modules['__main__'] = script_main
+
+class WorkerContext(multiprocessing.context.SpawnContext):
+    Process = _NeutralMainProcess
+
+_LINE_RE = re.compile(r'[^\n]+')
+
+# Penn tag prefixes checked per token (tok.tag_[:2] in ...)
+_NOUN_PREFIXES = frozenset({'NN'})
+_NOUN_ADJ_PREFIXES = frozenset({'NN', 'JJ'})
+
+@lru_cache(maxsize=None)
+def get_nlp():
+    # tokenizer + tagger only; the sentencizer replaces the (disabled) parser for doc.sents
+    nlp = spacy.load('en_core_web_sm', disable=['ner', 'parser', 'lemmatizer'])
+    nlp.add_pipe('sentencizer')
+    return nlp
+
+def parse_texts(texts):
+    # tag each distinct text once (generated questions and short seed pages repeat a lot), keep input order
+    unique = list(dict.fromkeys(texts))
+    docs = dict(zip(unique, get_nlp().pipe(unique, batch_size=32)))
+    return [docs[t] for t in texts]
+
+@lru_cache(maxsize=20000)
+def synonyms(w):
+    w_low = w.lower()
+    # single pass over all lemmas; the set drops duplicates shared between synsets
+    return tuple({n for s in wordnet.synsets(w) for l in s.lemmas() if (n := l.name().replace('_', ' ')).lower() != w_low})
+
+def paraphrase_simple(doc):
+    """
+    Lightweight rephrasing function WITHOUT GenAI:
+    - takes a spaCy Doc (see get_nlp) and walks its sentences
+    - applies synonym substitution on some nouns/adjectives using WordNet
+    - shuffles some clauses.
+    NOTE: this is intentionally conservative to avoid factual distortion.
+    """
+    words = [tok.text for tok in doc]
+    tags = [tok.tag_ for tok in doc]
+    # one uniform block for the whole doc: a draw per token, plus one for the shuffle decision
+    draws = np.random.random(len(words) + 1)
+    # attempt synonyms for adjectives and nouns sometimes
+    for i in np.flatnonzero(draws[:-1] < 0.28):
+        if tags[i][:2] in _NOUN_ADJ_PREFIXES:
+            lemmas = synonyms(words[i])
+            if lemmas:
+                words[i] = random.choice(lemmas)
+    # sentence boundaries are token offsets into the doc
+    out_sents = [' '.join(words[sent.start:sent.end]) for sent in doc.sents]
+    # maybe shuffle sentences a bit (to create novel ordering)
+    if len(out_sents) > 1 and draws[-1] < 0.3:
+        random.shuffle(out_sents)
+    return ' '.join(out_sents)
+
+def first_paras(text, n=5):
+    # scan lazily and stop after n non-blank lines instead of splitting the whole text
+    stripped = (m.group().strip() for m in _LINE_RE.finditer(text))
+    return list(islice((p for p in stripped if p), n))
+
+def pick_paragraph(text):
+    paras = first_paras(text)  # prefer first few paragraphs
+    if not paras: paras = [text]
+    return random.choice(paras)
+
+def generate_question_from_text(doc, topic):
+    """
+    Create an advanced, targeted question from a paragraph of article text.
+    Strategy:
+      - take the parsed paragraph (see pick_paragraph), identify important nouns, make scenario-based or 'how would you' questions.
+    """
+    # pick nouns via simple heuristic (Penn tags, so NNP proper nouns count too)
+    nouns = [tok.text for tok in doc if tok.tag_[:2] in _NOUN_PREFIXES and len(tok.text) > 3]
+    nouns = list(dict.fromkeys(nouns))
+    chosen = nouns[:3] if nouns else []
+    # craft tough question
+    if chosen:
+        core = ', '.join(chosen[:2])
+        q = f"In a production scenario involving {core}, what are the top non-obvious trade-offs you would evaluate, and how would you mitigate the top two risks? (Tie it into {topic} context.)"
+    else:
+        q = f"Describe an advanced challenge in {topic} that can arise from the technology discussed in the source, and propose a step-by-step resolution strategy."
+    return q
+
+def make_questions(texts, topic):
+    """
+    Build one paraphrased question per source text. Runs in a worker process (see app.get_process_pool).
+    """
+    para_docs = parse_texts([pick_paragraph(text) for text in texts])
+    q_texts = [generate_question_from_text(doc, topic) for doc in para_docs]
+    # rephrase the question to avoid exact wording using paraphrase_simple
+    return [paraphrase_simple(doc) for doc in parse_texts(q_texts)]
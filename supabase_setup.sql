@@ -26,6 +26,9 @@ create table if not exists answers (
   created_at timestamptz default now()
 );
 
+-- Review Past: latest answers per user (where user_id = ? order by created_at desc limit 50)
+create index if not exists answers_user_id_created_at_idx on answers (user_id, created_at desc);
+
 -- Table: views or review log
 create table if not exists review_logs (
   id uuid primary key default gen_random_uuid(),